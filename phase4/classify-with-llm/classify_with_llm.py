@@ -89,6 +89,7 @@ except ImportError:
 # Import shared preprocessing utilities
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from common.preprocessing import preprocess_content
+from common.parallel import map_jobs
 
 
 def check_dependencies():
@@ -127,13 +128,22 @@ def discover_files(puml_dir: Path) -> Dict[str, Dict[str, Any]]:
         Dictionary with file info: {filename: {path, word_count, needs_truncation, content}}
     """
     files = {}
-    puml_files = list(puml_dir.glob("*.puml"))
+    # scandir reuses directory entry types instead of glob's per-entry pattern matching
+    with os.scandir(puml_dir) as entries:
+        puml_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.puml') and entry.is_file()
+        ]
 
     print(f"Found {len(puml_files):,} .puml files", file=sys.stderr)
     print("Analyzing file sizes...", file=sys.stderr)
 
     if HAS_TQDM:
-        iterator = tqdm(puml_files, desc="Scanning", unit="file")
+        # Refresh ~1000 times per run; per-file redraws dominate on fast scans
+        iterator = tqdm(
+            puml_files, desc="Scanning", unit="file",
+            miniters=max(1, len(puml_files) // 1000), mininterval=0.2, smoothing=0.1
+        )
     else:
         iterator = puml_files
 
@@ -183,12 +193,13 @@ def sanitize_custom_id(filename: str) -> str:
     return name[:64]
 
 
-def create_batch_requests(files: Dict[str, Dict[str, Any]]) -> tuple[List[Dict[str, Any]], Dict[str, str], set]:
+def create_batch_requests(files: Dict[str, Dict[str, Any]], jobs: int = 1) -> tuple[List[Dict[str, Any]], Dict[str, str], set]:
     """
     Create batch API requests for files that need classification.
 
     Args:
         files: Dictionary of file info from discover_files
+        jobs: Number of processes used to preprocess file contents
 
     Returns:
         Tuple of (request list, id_to_filename mapping, set of truncated filenames)
@@ -197,13 +208,16 @@ def create_batch_requests(files: Dict[str, Dict[str, Any]]) -> tuple[List[Dict[s
     id_to_filename = {}  # Maps custom_id -> original filename
     truncated_files = set()  # Track which files were truncated
 
-    for filename, info in files.items():
-        if info['content'] is None:
-            continue
+    readable = [(filename, info) for filename, info in files.items() if info['content'] is not None]
+    contents = [info['content'] for _, info in readable]
 
-        # Preprocess content
-        preprocessed = preprocess_content(info['content'])
+    # Preprocess content (CPU-bound regex work, so fan out across processes)
+    preprocessed_contents = list(map_jobs(
+        preprocess_content, contents,
+        jobs=jobs if len(contents) > 1 else 1, chunksize=32,
+    ))
 
+    for (filename, info), preprocessed in zip(readable, preprocessed_contents):
         # Truncate if content exceeds word limit
         if info.get('needs_truncation'):
             preprocessed = truncate_to_words(preprocessed, TRUNCATE_WORD_COUNT)
@@ -506,6 +520,14 @@ def generate_output(
 
     classifications = {}
 
+    # Statistics are accumulated in the same pass that collects results
+    successful = 0
+    truncated_count = 0
+    errored = 0
+    type_dist = {}
+    confidence_sum = 0.0
+    confidence_count = 0
+
     # Add results from API
     for filename, result in results.items():
         # Mark truncated files
@@ -513,24 +535,25 @@ def generate_output(
             result['truncated'] = True
         classifications[filename] = result
 
-    # Calculate statistics
-    total_files = len(files)
-    successful = sum(1 for c in classifications.values()
-                    if c.get('diagram_type') == 'uml' and not c.get('error') and not c.get('parse_error'))
-    truncated_count = sum(1 for c in classifications.values() if c.get('truncated'))
-    errored = sum(1 for c in classifications.values() if c.get('error') or c.get('parse_error'))
-
-    # Type distribution
-    type_dist = {}
-    confidences = []
-    for c in classifications.values():
-        if c.get('diagram_type') == 'uml' and c.get('primary_type'):
-            ptype = c['primary_type']
-            type_dist[ptype] = type_dist.get(ptype, 0) + 1
-            if c.get('confidence') is not None:
-                confidences.append(c['confidence'])
+        failed = result.get('error') or result.get('parse_error')
+        if failed:
+            errored += 1
+        if result.get('truncated'):
+            truncated_count += 1
+
+        if result.get('diagram_type') == 'uml':
+            if not failed:
+                successful += 1
+            # Type distribution
+            ptype = result.get('primary_type')
+            if ptype:
+                type_dist[ptype] = type_dist.get(ptype, 0) + 1
+                if result.get('confidence') is not None:
+                    confidence_sum += result['confidence']
+                    confidence_count += 1
 
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    total_files = len(files)
+    avg_confidence = confidence_sum / confidence_count if confidence_count else 0.0
 
     # Processing time
     duration = end_time - start_time
@@ -598,6 +621,13 @@ Environment Variables:
         help="Resume from saved state file"
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for preprocessing (default: 1)"
+    )
+
     args = parser.parse_args()
 
     # Check dependencies
@@ -642,7 +672,7 @@ Environment Variables:
 
     # Create batch requests (needed for id_to_filename mapping)
     print("\nPreparing batch requests...", file=sys.stderr)
-    requests, id_to_filename, truncated_files = create_batch_requests(files)
+    requests, id_to_filename, truncated_files = create_batch_requests(files, args.jobs)
     print(f"Total requests to submit: {len(requests):,}", file=sys.stderr)
     if truncated_files:
         print(f"Files truncated to {TRUNCATE_WORD_COUNT} words: {len(truncated_files):,}", file=sys.stderr)
@@ -0,0 +1,45 @@
+"""
+Shared process-pool helper for PlantUML analysis scripts.
+
+This module backs the --jobs option of:
+- classify_with_llm.py (diagram classification)
+- count_elements.py (element counting)
+- count_lines.py (LOC counting)
+- count_relationships.py (relationship counting)
+- validate_consistency.py (consistency validation)
+
+Worker processes use the platform's default start method.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator
+
+
+def map_jobs(
+    func: Callable[..., Any],
+    *iterables: Iterable[Any],
+    jobs: int = 1,
+    chunksize: int = 1,
+) -> Iterator[Any]:
+    """
+    Apply a function to every item, serially or in a process pool.
+
+    Works like the builtin map(): results are yielded in input order.
+    With jobs > 1 the pool lives until the results are exhausted or the
+    iterator is closed.
+
+    Args:
+        func: Module-level (picklable) function to apply
+        *iterables: Argument iterables, as for map()
+        jobs: Number of worker processes; 1 or less runs in this process
+        chunksize: Number of items sent to a worker at a time
+
+    Yields:
+        func(*args) for each set of arguments
+    """
+    if jobs <= 1:
+        yield from map(func, *iterables)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(func, *iterables, chunksize=chunksize)
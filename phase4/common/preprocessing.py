@@ -13,6 +13,111 @@ sprites, and notes to avoid false positives in analysis.
 import re
 
 
+# Compiled patterns, shared by every call (grouped by strip_* function)
+
+# Comments
+MULTILINE_COMMENT_PATTERN = re.compile(r"/'.*?'/", re.DOTALL)
+LINE_COMMENT_PATTERN = re.compile(r"^\s*'+")
+COMMENT_CANDIDATE_LINE_PATTERN = re.compile(r"^[^'\n]*'.*", re.MULTILINE)
+INLINE_COMMENT_MARKER_PATTERN = re.compile(r"^'|(?<=[ \t])'(?![^ \t])")
+
+# Styling blocks
+SKINPARAM_BLOCK_PATTERN = re.compile(
+    r'skinparam\s+\w+\s*\{[^}]*\}', re.DOTALL | re.IGNORECASE
+)
+SKINPARAM_LINE_PATTERN = re.compile(
+    r'^\s*skinparam\s+.*$', re.MULTILINE | re.IGNORECASE
+)
+HIDE_SHOW_PATTERN = re.compile(
+    r'^\s*(hide|show)\s+.*$', re.MULTILINE | re.IGNORECASE
+)
+STYLE_BLOCK_PATTERN = re.compile(
+    r'style\s+\w+\s*\{[^}]*\}', re.DOTALL | re.IGNORECASE
+)
+
+# Sprites
+SPRITE_HEX_PATTERN = re.compile(
+    r'sprite\s+\$?[\w-]+\s*\[[^\]]+\]\s*\{[^}]*\}', re.DOTALL | re.IGNORECASE
+)
+SPRITE_SVG_PATTERN = re.compile(
+    r'sprite\s+\$?[\w-]+\s*<svg[^>]*>.*?</svg>', re.DOTALL | re.IGNORECASE
+)
+
+# Preprocessor directives
+DEFINE_PATTERN = re.compile(r'^\s*!define\s+.*$', re.MULTILINE)
+INCLUDE_PATTERN = re.compile(r'^\s*!include\s+.*$', re.MULTILINE)
+PROCEDURE_PATTERN = re.compile(
+    r'!procedure\b.*?!endprocedure', re.DOTALL | re.IGNORECASE
+)
+FUNCTION_PATTERN = re.compile(
+    r'!function\b.*?!endfunction', re.DOTALL | re.IGNORECASE
+)
+VARIABLE_PATTERN = re.compile(r'^\s*!\$\w+\s*=.*$', re.MULTILINE)
+UNQUOTED_PATTERN = re.compile(r'^\s*!unquoted\s+.*$', re.MULTILINE)
+
+# Notes
+NOTE_SINGLE_PATTERN = re.compile(
+    r'^\s*note\s+(?:left|right|top|bottom|over)(?:\s+of\s+\w+)?\s*:.*$',
+    re.MULTILINE | re.IGNORECASE
+)
+NOTE_MULTI_PATTERN = re.compile(
+    r'\bnote\s+(?:left|right|top|bottom|over)?(?:\s+of\s+\w+)?\s*\n.*?\bend\s+note\b',
+    re.DOTALL | re.IGNORECASE
+)
+NOTE_FLOATING_PATTERN = re.compile(
+    r'^\s*note\s+"[^"]*"(?:\s+as\s+\w+)?.*$', re.MULTILINE | re.IGNORECASE
+)
+
+# Documentation blocks
+HEADER_BLOCK_PATTERN = re.compile(
+    r'\b(left|right|center)?\s*header\b.*?\bendheader\b', re.DOTALL | re.IGNORECASE
+)
+FOOTER_BLOCK_PATTERN = re.compile(
+    r'\b(left|right|center)?\s*footer\b.*?\bendfooter\b', re.DOTALL | re.IGNORECASE
+)
+HEADER_FOOTER_LINE_PATTERN = re.compile(
+    r'^\s*(left|right|center)?\s*(header|footer)\s+.*$', re.MULTILINE | re.IGNORECASE
+)
+TITLE_PATTERN = re.compile(r'^\s*title\s+.*$', re.MULTILINE | re.IGNORECASE)
+LEGEND_PATTERN = re.compile(r'\blegend\b.*?\bendlegend\b', re.DOTALL | re.IGNORECASE)
+CAPTION_PATTERN = re.compile(r'^\s*caption\s+.*$', re.MULTILINE | re.IGNORECASE)
+
+# Class-like declarations whose bodies strip_member_bodies() removes
+CLASS_DECLARATION_PATTERN = re.compile(
+    r'\b(?:abstract\s+)?(?:class|interface|enum|struct)\s+\S+',
+    re.IGNORECASE
+)
+BRACE_PATTERN = re.compile(r'[{}]')
+
+# Non-ASCII characters that re.IGNORECASE matches against ASCII letters
+IGNORECASE_ASCII_FOLDS = str.maketrans({
+    '\u0130': 'i',  # LATIN CAPITAL LETTER I WITH DOT ABOVE
+    '\u0131': 'i',  # LATIN SMALL LETTER DOTLESS I
+    '\u017f': 's',  # LATIN SMALL LETTER LONG S
+    '\u212a': 'k',  # KELVIN SIGN
+})
+
+
+def _keyword_text(content: str) -> str:
+    """
+    Lowercase content for cheap keyword checks before running a regex.
+
+    Most diagrams contain none of the constructs a strip_* pattern removes,
+    so a substring test on this text lets the regex pass be skipped. The
+    few non-ASCII letters that IGNORECASE equates with ASCII are folded
+    too, so a keyword absent here can never be matched by the pattern.
+
+    Args:
+        content: PlantUML content
+
+    Returns:
+        Lowercased content suitable for `keyword in text` checks
+    """
+    if content.isascii():
+        return content.lower()
+    return content.translate(IGNORECASE_ASCII_FOLDS).lower()
+
+
 def remove_inline_comment(line: str) -> str:
     """
     Remove inline PlantUML comment from a single line.
@@ -28,57 +133,26 @@ def remove_inline_comment(line: str) -> str:
     Returns:
         Line with comment removed
     """
-    result = []
-    in_string = False
-    i = 0
+    # Candidate markers: ' at line start, or ' after whitespace that is
+    # followed by whitespace/end of line ('text' and Alice's don't match).
+    # A candidate is a comment only outside double-quoted strings, i.e. when
+    # an even number of quotes precedes it.
+    for match in INLINE_COMMENT_MARKER_PATTERN.finditer(line):
+        start = match.start()
+        if line.count('"', 0, start) % 2 == 0:
+            return line[:start].rstrip(' \t')
 
-    while i < len(line):
-        char = line[i]
-
-        # Toggle string state on double-quote
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
-
-        # Check for comment marker
-        elif char == "'" and not in_string:
-            # Comment rules: ' starts a comment if:
-            # 1. At start of line (already handled by regex)
-            # 2. Preceded by whitespace AND followed by space/tab (typical comment)
-            # 3. Preceded by whitespace AND at end of line
-            # Otherwise, preserve it (could be 'text' or Alice's)
-
-            if i == 0:
-                # At start of line (but this should be caught by regex already)
-                break
-            elif result and result[-1] in (' ', '\t'):
-                # Preceded by whitespace - check what follows
-                if i + 1 >= len(line):
-                    # At end of line after whitespace -> comment
-                    while result and result[-1] in (' ', '\t'):
-                        result.pop()
-                    break
-                elif line[i + 1] in (' ', '\t'):
-                    # Followed by space/tab -> comment
-                    while result and result[-1] in (' ', '\t'):
-                        result.pop()
-                    break
-                else:
-                    # Preceded by space but not followed by space ('text' pattern)
-                    result.append(char)
-                    i += 1
-            else:
-                # In middle of word (e.g., "Alice's") -> NOT a comment
-                result.append(char)
-                i += 1
-
-        # Normal character
-        else:
-            result.append(char)
-            i += 1
+    return line
 
-    return ''.join(result)
+
+def _strip_comment_line(match: re.Match) -> str:
+    """Clean one line matched by COMMENT_CANDIDATE_LINE_PATTERN."""
+    line = match.group()
+    if LINE_COMMENT_PATTERN.match(line):
+        # Entire line is a comment
+        return ''
+    # Remove inline comments (preserve strings)
+    return remove_inline_comment(line)
 
 
 def strip_comments(content: str) -> str:
@@ -96,22 +170,17 @@ def strip_comments(content: str) -> str:
     Returns:
         Content with comments removed, newlines preserved
     """
-    # Remove multi-line comments: /' ... '/
-    content = re.sub(r"/'.*?'/", "", content, flags=re.DOTALL)
+    # Every comment form needs an apostrophe - nothing to strip without one
+    if "'" not in content:
+        return content
 
-    # Remove single-line comments: ' or '' at start of line
-    lines = content.split('\n')
-    cleaned_lines = []
-    for line in lines:
-        # Remove anything after ' at start or after whitespace
-        if re.match(r"^\s*'+", line):
-            # Entire line is a comment
-            cleaned_lines.append('')
-        else:
-            # Remove inline comments (preserve strings)
-            cleaned_lines.append(remove_inline_comment(line))
+    # Remove multi-line comments: /' ... '/
+    if "/'" in content:
+        content = MULTILINE_COMMENT_PATTERN.sub("", content)
 
-    return '\n'.join(cleaned_lines)
+    # Remove single-line and inline comments in one pass; only lines that
+    # contain an apostrophe are matched, everything else is copied in C
+    return COMMENT_CANDIDATE_LINE_PATTERN.sub(_strip_comment_line, content)
 
 
 def strip_styling_blocks(content: str) -> str:
@@ -130,39 +199,27 @@ def strip_styling_blocks(content: str) -> str:
     Returns:
         Content with styling blocks removed
     """
-    # Remove skinparam blocks: skinparam Type { ... }
-    content = re.sub(
-        r'skinparam\s+\w+\s*\{[^}]*\}',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
-
-    # Remove skinparam single-line: skinparam Type value
-    # Handles: skinparam Type value, skinparam Type<<stereotype>> value
-    content = re.sub(
-        r'^\s*skinparam\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE | re.IGNORECASE
-    )
+    # Each pass only runs when its keyword is present. Block removals can
+    # join text into a new keyword, so the keyword text is refreshed after them.
+    text = _keyword_text(content)
+
+    if 'skinparam' in text:
+        # Remove skinparam blocks: skinparam Type { ... }
+        content = SKINPARAM_BLOCK_PATTERN.sub('', content)
+
+        # Remove skinparam single-line: skinparam Type value
+        # Handles: skinparam Type value, skinparam Type<<stereotype>> value
+        content = SKINPARAM_LINE_PATTERN.sub('', content)
+        text = _keyword_text(content)
 
     # Remove hide/show directives (single line)
     # Examples: hide footbox, hide class members, show component interface
-    content = re.sub(
-        r'^\s*(hide|show)\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE | re.IGNORECASE
-    )
+    if 'hide' in text or 'show' in text:
+        content = HIDE_SHOW_PATTERN.sub('', content)
 
     # Remove style blocks: style Type { ... }
-    content = re.sub(
-        r'style\s+\w+\s*\{[^}]*\}',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    if 'style' in text:
+        content = STYLE_BLOCK_PATTERN.sub('', content)
 
     return content
 
@@ -181,22 +238,15 @@ def strip_sprite_blocks(content: str) -> str:
     Returns:
         Content with sprite blocks removed
     """
+    if 'sprite' not in _keyword_text(content):
+        return content
+
     # Remove hex/raster sprite blocks: sprite $name [dimensions] { ... }
     # Name pattern allows hyphens, underscores, and alphanumerics (e.g., $backbone-icon)
-    content = re.sub(
-        r'sprite\s+\$?[\w-]+\s*\[[^\]]+\]\s*\{[^}]*\}',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    content = SPRITE_HEX_PATTERN.sub('', content)
 
     # Remove SVG inline sprites: sprite $name <svg>...</svg>
-    content = re.sub(
-        r'sprite\s+\$?[\w-]+\s*<svg[^>]*>.*?</svg>',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    content = SPRITE_SVG_PATTERN.sub('', content)
 
     return content
 
@@ -223,53 +273,37 @@ def strip_preprocessor_directives(content: str) -> str:
     Returns:
         Content with preprocessor directives removed
     """
+    # Every directive starts with '!' - most diagrams have none at all
+    if '!' not in content:
+        return content
+
+    # Each pass only runs when its directive is present (see strip_styling_blocks)
+
     # Remove !define lines (macro definitions)
-    content = re.sub(
-        r'^\s*!define\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE
-    )
+    if '!define' in content:
+        content = DEFINE_PATTERN.sub('', content)
 
     # Remove !include lines (file inclusions)
-    content = re.sub(
-        r'^\s*!include\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE
-    )
+    if '!include' in content:
+        content = INCLUDE_PATTERN.sub('', content)
 
     # Remove !procedure...!endprocedure blocks
-    content = re.sub(
-        r'!procedure\b.*?!endprocedure',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    text = _keyword_text(content)
+    if '!endprocedure' in text:
+        content = PROCEDURE_PATTERN.sub('', content)
+        text = _keyword_text(content)
 
     # Remove !function...!endfunction blocks
-    content = re.sub(
-        r'!function\b.*?!endfunction',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    if '!endfunction' in text:
+        content = FUNCTION_PATTERN.sub('', content)
 
     # Remove !$variable assignments
-    content = re.sub(
-        r'^\s*!\$\w+\s*=.*$',
-        '',
-        content,
-        flags=re.MULTILINE
-    )
+    if '!$' in content:
+        content = VARIABLE_PATTERN.sub('', content)
 
     # Remove !unquoted definitions
-    content = re.sub(
-        r'^\s*!unquoted\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE
-    )
+    if '!unquoted' in content:
+        content = UNQUOTED_PATTERN.sub('', content)
 
     return content
 
@@ -299,39 +333,34 @@ def strip_member_bodies(content: str) -> str:
     """
     result = []
     i = 0
-    class_pattern = re.compile(
-        r'\b(?:abstract\s+)?(?:class|interface|enum|struct)\s+\S+',
-        re.IGNORECASE
-    )
-
-    while i < len(content):
-        match = class_pattern.match(content, i)
-        if match:
-            # Found class-like definition
-            result.append(match.group())
-            i = match.end()
-
-            # Copy everything until opening brace (stereotypes, etc.)
-            while i < len(content) and content[i] != '{':
-                result.append(content[i])
-                i += 1
-
-            if i < len(content) and content[i] == '{':
-                # Skip body content with proper brace depth tracking
-                brace_depth = 1
-                i += 1  # Skip opening brace
-
-                while i < len(content) and brace_depth > 0:
-                    if content[i] == '{':
-                        brace_depth += 1
-                    elif content[i] == '}':
-                        brace_depth -= 1
-                    i += 1
-
-                result.append('{ }')  # Replace body with empty braces
-        else:
-            result.append(content[i])
-            i += 1
+    length = len(content)
+
+    while i < length:
+        match = CLASS_DECLARATION_PATTERN.search(content, i)
+        if not match:
+            result.append(content[i:])
+            break
+
+        # Found class-like definition; copy preceding text verbatim
+        result.append(content[i:match.end()])
+
+        # Copy everything until opening brace (stereotypes, etc.)
+        brace = content.find('{', match.end())
+        if brace == -1:
+            result.append(content[match.end():])
+            break
+        result.append(content[match.end():brace])
+
+        # Skip body content with proper brace depth tracking
+        brace_depth = 1
+        i = length
+        for token in BRACE_PATTERN.finditer(content, brace + 1):
+            brace_depth += 1 if token.group() == '{' else -1
+            if brace_depth == 0:
+                i = token.end()
+                break
+
+        result.append('{ }')  # Replace body with empty braces
 
     return ''.join(result)
 
@@ -354,31 +383,19 @@ def strip_notes(content: str) -> str:
     Returns:
         Content with note blocks removed
     """
+    if 'note' not in _keyword_text(content):
+        return content
+
     # Step 1: Remove single-line notes FIRST (note ... : text on same line)
     # This prevents multi-line regex from incorrectly spanning across them
-    content = re.sub(
-        r'^\s*note\s+(?:left|right|top|bottom|over)(?:\s+of\s+\w+)?\s*:.*$',
-        '',
-        content,
-        flags=re.MULTILINE | re.IGNORECASE
-    )
+    content = NOTE_SINGLE_PATTERN.sub('', content)
 
     # Step 2: Remove multi-line notes (note ... \n ... end note)
     # These start with note keyword followed by newline (no colon on same line)
-    content = re.sub(
-        r'\bnote\s+(?:left|right|top|bottom|over)?(?:\s+of\s+\w+)?\s*\n.*?\bend\s+note\b',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    content = NOTE_MULTI_PATTERN.sub('', content)
 
     # Step 3: Handle floating notes: note "text" as N1
-    content = re.sub(
-        r'^\s*note\s+"[^"]*"(?:\s+as\s+\w+)?.*$',
-        '',
-        content,
-        flags=re.MULTILINE | re.IGNORECASE
-    )
+    content = NOTE_FLOATING_PATTERN.sub('', content)
 
     return content
 
@@ -401,53 +418,35 @@ def strip_footer_header(content: str) -> str:
     Returns:
         Content with documentation blocks removed
     """
+    # Each pass only runs when its keyword is present (see strip_styling_blocks)
+    text = _keyword_text(content)
+
     # Remove multi-line header blocks
-    content = re.sub(
-        r'\b(left|right|center)?\s*header\b.*?\bendheader\b',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    if 'endheader' in text:
+        content = HEADER_BLOCK_PATTERN.sub('', content)
+        text = _keyword_text(content)
 
     # Remove multi-line footer blocks
-    content = re.sub(
-        r'\b(left|right|center)?\s*footer\b.*?\bendfooter\b',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    if 'endfooter' in text:
+        content = FOOTER_BLOCK_PATTERN.sub('', content)
+        text = _keyword_text(content)
 
     # Remove single-line header/footer
-    content = re.sub(
-        r'^\s*(left|right|center)?\s*(header|footer)\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE | re.IGNORECASE
-    )
+    if 'header' in text or 'footer' in text:
+        content = HEADER_FOOTER_LINE_PATTERN.sub('', content)
 
     # Remove title lines
-    content = re.sub(
-        r'^\s*title\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE | re.IGNORECASE
-    )
+    if 'title' in text:
+        content = TITLE_PATTERN.sub('', content)
 
     # Remove legend blocks
-    content = re.sub(
-        r'\blegend\b.*?\bendlegend\b',
-        '',
-        content,
-        flags=re.DOTALL | re.IGNORECASE
-    )
+    if 'endlegend' in text:
+        content = LEGEND_PATTERN.sub('', content)
+        text = _keyword_text(content)
 
     # Remove caption lines
-    content = re.sub(
-        r'^\s*caption\s+.*$',
-        '',
-        content,
-        flags=re.MULTILINE | re.IGNORECASE
-    )
+    if 'caption' in text:
+        content = CAPTION_PATTERN.sub('', content)
 
     return content
 
@@ -19,6 +19,7 @@ import argparse
 import json
 import re
 import sys
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Set, Any, List, Optional
@@ -30,10 +31,18 @@ try:
 except ImportError:
     HAS_TQDM = False
 
+# Try to import orjson for faster JSON output
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import shared preprocessing utilities
 import sys as _sys
 _sys.path.insert(0, str(Path(__file__).parent.parent))
 from common.preprocessing import preprocess_content, strip_member_bodies
+from common.parallel import map_jobs
 
 
 # =============================================================================
@@ -114,14 +123,14 @@ for _elem_type, _keywords in ELEMENT_TYPES.items():
         KEYWORD_TO_TYPE[_keyword] = _elem_type
 
 # All keywords for regex (sorted by length descending to match longer first)
-ALL_KEYWORDS = sorted(KEYWORD_TO_TYPE.keys(), key=len, reverse=True)
+ALL_KEYWORDS = tuple(sorted(KEYWORD_TO_TYPE.keys(), key=len, reverse=True))
 
 # Default implicit element type by primary diagram type
 # Supported UML diagram types for element counting
-SUPPORTED_DIAGRAM_TYPES = {
+SUPPORTED_DIAGRAM_TYPES = frozenset({
     'class', 'sequence', 'usecase', 'component',
     'activity', 'object', 'deployment', 'state', 'timing'
-}
+})
 
 # Note: activity diagrams use partition/group containers, not a specific element type
 IMPLICIT_DEFAULTS = {
@@ -137,7 +146,7 @@ IMPLICIT_DEFAULTS = {
 }
 
 # Keywords to ignore when detecting implicit elements
-IGNORE_KEYWORDS = {
+IGNORE_KEYWORDS = frozenset({
     'hide', 'show', 'remove', 'skinparam', 'title', 'footer', 'header',
     'legend', 'note', 'url', 'left', 'right', 'top', 'bottom', 'of',
     'start', 'stop', 'end', 'if', 'else', 'endif', 'together',
@@ -145,16 +154,193 @@ IGNORE_KEYWORDS = {
     'loop', 'alt', 'opt', 'par', 'break', 'critical',
     'ref', 'activate', 'deactivate', 'create', 'destroy',
     'return', 'newpage', 'autonumber',
-}
+})
 
 # Keywords that are control flow in sequence diagrams but elements elsewhere
 # group is a structural container in Deployment/Activity but control flow in Sequence
-SEQUENCE_CONTROL_FLOW = {
+SEQUENCE_CONTROL_FLOW = frozenset({
     'group', 'alt', 'opt', 'par', 'break', 'critical', 'loop', 'ref',
-}
+})
+
+
+def _trie_pattern(words) -> str:
+    """Build a prefix-factored regex alternation matching exactly `words`.
+
+    Shared prefixes are matched once (e.g. ``a(?:bstract(?:\\ class)?|ctor)``)
+    instead of retrying every keyword from scratch. Where one word is a prefix
+    of another, the optional suffix is greedy, so the longer word is still
+    tried first - the same behaviour as a longest-first alternation.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+# Explicit declarations: one trie-factored alternation over every element keyword
+_KEYWORDS_ALTERNATION = _trie_pattern(ALL_KEYWORDS)
+EXPLICIT_DECLARATION_PATTERN = re.compile(rf'''
+    ^\s*                                    # line start
+    [+\-#~]?                               # optional visibility modifier
+    ({_KEYWORDS_ALTERNATION})              # keyword (group 1)
+    \s+                                    # required whitespace
+    (?:
+        "([^"]+)"                          # quoted name (group 2)
+        |
+        ([\w.$]+(?:<[^>]+>)?)              # unquoted name with dots/unicode (group 3)
+    )
+    (?:\s*<<[^>]*>>)?                      # optional stereotype
+    (?:\s*\#[a-zA-Z0-9]+)?                 # optional color
+    (?:\s+as\s+(?:"([^"]+)"|([\w.$]+)))?  # alias with dots/unicode (groups 4, 5)
+''', re.MULTILINE | re.VERBOSE | re.IGNORECASE)
+
+# Generic parameters stripped from declared names: List<T> -> List
+GENERICS_PATTERN = re.compile(r'<[^>]+>')
+
+# Bracket component: [Name] with optional stereotype and alias
+# Must be at line start (not a bracket label in arrow like A --> B : [label])
+BRACKET_COMPONENT_PATTERN = re.compile(r'''
+    ^\s*                                    # line start
+    \[                                      # opening bracket
+    ([^\]]+)                               # component name (group 1)
+    \]                                      # closing bracket
+    (?:\s*<<[^>]*>>)?                      # optional stereotype
+    (?:\s*\#[a-zA-Z0-9]+)?                 # optional color
+    (?:\s+as\s+(?:"([^"]+)"|([\w.$]+)))?  # alias with dots/unicode (groups 2, 3)
+''', re.MULTILINE | re.VERBOSE)
+
+# Interface: () followed by name - lollipop interface notation
+# Matches: () "Name", () Name, ()Name
+LOLLIPOP_INTERFACE_PATTERN = re.compile(r'''
+    ^\s*                                    # line start
+    \(\s*\)                                # empty parentheses ()
+    \s*                                    # optional whitespace
+    (?:
+        "([^"]+)"                          # quoted name (group 1)
+        |
+        ([\w.$]+)                          # unquoted name with dots/unicode (group 2)
+    )
+    (?:\s*<<[^>]*>>)?                      # optional stereotype
+    (?:\s+as\s+(?:"([^"]+)"|([\w.$]+)))?  # alias with dots/unicode (groups 3, 4)
+''', re.MULTILINE | re.VERBOSE)
+
+# Usecase: (UseCase Name) with optional alias
+# Must not match (*) or empty ()
+USECASE_PARENTHESES_PATTERN = re.compile(r'''
+    (?:^|[\s\n])                           # line start or whitespace
+    \(                                     # opening paren
+    ([^()*\n][^)\n]*?)                     # usecase name - not starting with * or (
+    \)                                     # closing paren
+    (?:\s+as\s+\(([^)]+)\))?               # optional alias in parens
+    (?:\s+as\s+([\w.$]+))?                 # or plain alias with dots/unicode
+''', re.MULTILINE | re.VERBOSE)
+
+# Usecase: "Quoted Name" as (Identifier) - common in usecase diagrams
+QUOTED_ALIAS_USECASE_PATTERN = re.compile(r'''
+    "([^"]+)"                              # quoted name
+    \s+as\s+
+    \(([^)]+)\)                            # parenthesized identifier
+''', re.MULTILINE | re.VERBOSE)
+
+# Creole actor: :Name: with optional alias
+# Must not be followed by semicolon (activity) or preceded by arrow (sequence)
+CREOLE_ACTOR_PATTERN = re.compile(r'''
+    (?:^|(?<![->.]))                       # not preceded by arrow chars
+    \s*
+    :([^:\n;]+):                           # :name: - no colons, newlines, or semicolons inside
+    (?!\s*;)                               # not followed by semicolon (activity syntax)
+    (?:\s+as\s+([\w.$]+))?                 # optional alias with dots/unicode
+''', re.MULTILINE | re.VERBOSE)
+
+# Main relationship pattern - covers class, component, deployment, etc.
+# Supports both quoted and unquoted element names
+# Note: Cardinality markers like "1", "*" are filtered by is_cardinality()
+# Note: (*) is activity diagram start/end marker, matched but filtered out
+# Structure: LEFT [CARDINALITY] ARROW [LABEL/CARDINALITY] RIGHT
+RELATION_PATTERN = re.compile(r'''
+    (?:^|\s)                               # line start or whitespace
+    (?:
+        "([^"]+)"                          # quoted left element (group 1)
+        |
+        ([\w.$]+)                          # unquoted left element with dots/unicode (group 2)
+        |
+        \(([^()*\n][^)\n]*)\)              # parenthesized usecase left (group 3)
+        |
+        \(\*\)                             # activity start/end marker (not captured)
+    )
+    (?:[ \t]*"[^"\n]*")?                   # optional cardinality after left (same line)
+    [ \t]*
+    (
+        # Async/special sequence (most specific first)
+        ->>|<<-                            # async message
+        |
+        ->x|x<-                            # lost/found message
+        |
+        <->                                # bidirectional
+        |
+        # Inheritance/realization with direction
+        (?:<\|)?[-.](?:up|down|left|right|u|d|l|r)?[-.][-.]?(?:\|>|>)?
+        |
+        (?:<)?[-.][-.]+(?:\|>|>)?
+        |
+        # Composition/aggregation/deployment endpoints
+        [*o#x+^0][-.][-.]+ | [-.][-.]+[*o#x+^0]
+        |
+        # Dotted dependency
+        \.\.+>|<\.\.+
+        |
+        # Simple arrows (single dash - common in sequence)
+        <-+|-+>
+    )
+    [ \t]*
+    (?:"[^"\n]*"[ \t]*)?                   # optional cardinality after arrow (same line)
+    (?:\[[^\]\n]*\][ \t]*)?                # optional bracket label [ OK ] (same line)
+    (?:
+        "([^"]+)"                          # quoted right element (group 5)
+        |
+        ([\w.$]+)                          # unquoted right element with dots/unicode (group 6)
+        |
+        \(([^()*\n][^)\n]*)\)              # parenthesized usecase right (group 7)
+        |
+        \(\*\)                             # activity start/end marker (not captured)
+    )
+''', re.VERBOSE)
+
+# Sequence diagram message pattern: Alice -> Bob : message
+# Supports both quoted and unquoted participant names
+SEQUENCE_MESSAGE_PATTERN = re.compile(r'''
+    ^\s*                                   # line start
+    (?:
+        "([^"]+)"                          # quoted left participant (group 1)
+        |
+        ([\w.$]+)                          # unquoted left participant with dots/unicode (group 2)
+    )
+    \s*
+    (<?-+>>?|<?\.+>?)                      # arrow (group 3)
+    \s*
+    (?:
+        "([^"]+)"                          # quoted right participant (group 4)
+        |
+        ([\w.$]+)                          # unquoted right participant with dots/unicode (group 5)
+    )
+    \s*:\s*                                # colon separator (sequence msg label)
+''', re.VERBOSE | re.MULTILINE)
 
-# Pattern to detect cardinality markers like "1", "*", "0..*", "1..*"
-CARDINALITY_PATTERN = re.compile(r'^[\d*]+(?:\.\.[\d*]+)?$')
+# Bracket notation in relationships: [A] --> [B] (left and right side)
+BRACKET_RELATION_LEFT_PATTERN = re.compile(r'\[([^\]]+)\]\s*(?:--?>|<--?|\.\.>|<\.\.|\*--|--\*|o--|--o)')
+BRACKET_RELATION_RIGHT_PATTERN = re.compile(r'(?:--?>|<--?|\.\.>|<\.\.|\*--|--\*|o--|--o)\s*\[([^\]]+)\]')
 
 
 # =============================================================================
@@ -182,34 +368,15 @@ def extract_explicit(
         alias_map: Dict mapping aliases to canonical names
         primary_type: Primary diagram type (affects contextual element handling)
     """
-    keywords_pattern = '|'.join(re.escape(kw) for kw in ALL_KEYWORDS)
-
-    pattern = rf'''
-        ^\s*                                    # line start
-        [+\-#~]?                               # optional visibility modifier
-        ({keywords_pattern})                   # keyword (group 1)
-        \s+                                    # required whitespace
-        (?:
-            "([^"]+)"                          # quoted name (group 2)
-            |
-            ([\w.$]+(?:<[^>]+>)?)              # unquoted name with dots/unicode (group 3)
-        )
-        (?:\s*<<[^>]*>>)?                      # optional stereotype
-        (?:\s*\#[a-zA-Z0-9]+)?                 # optional color
-        (?:\s+as\s+(?:"([^"]+)"|([\w.$]+)))?  # alias with dots/unicode (groups 4, 5)
-    '''
-
-    for match in re.finditer(pattern, content, re.MULTILINE | re.VERBOSE | re.IGNORECASE):
-        keyword_raw = match.group(1).lower()
+    for match in EXPLICIT_DECLARATION_PATTERN.finditer(content):
+        # The keyword group only matches whole keywords ('abstract class'
+        # included), so the lowered text is already a KEYWORD_TO_TYPE key
+        keyword = match.group(1).lower()
         quoted_name = match.group(2)
         unquoted_name = match.group(3)
         alias_quoted = match.group(4)
         alias_unquoted = match.group(5)
 
-        keyword = keyword_raw.strip()
-        if 'abstract' in keyword and 'class' in keyword:
-            keyword = 'abstract class'
-
         # Skip 'group' in sequence diagrams (it's control flow, not a structural element)
         if keyword == 'group' and primary_type == 'sequence':
             continue
@@ -231,9 +398,10 @@ def extract_explicit(
         elements[elem_type].add(canonical_name)
         declared_names.add(name_lower)
 
-        name_no_generics = re.sub(r'<[^>]+>', '', canonical_name).lower()
-        if name_no_generics != name_lower:
-            declared_names.add(name_no_generics)
+        if '<' in canonical_name:
+            name_no_generics = GENERICS_PATTERN.sub('', canonical_name).lower()
+            if name_no_generics != name_lower:
+                declared_names.add(name_no_generics)
 
         alias = alias_quoted if alias_quoted else alias_unquoted
         if alias:
@@ -260,19 +428,10 @@ def extract_bracket_components(
 
     Note: Skips state diagram markers like [*], [H], [H*]
     """
-    # Pattern: [Name] with optional stereotype and alias
-    # Must be at line start (not a bracket label in arrow like A --> B : [label])
-    bracket_pattern = r'''
-        ^\s*                                    # line start
-        \[                                      # opening bracket
-        ([^\]]+)                               # component name (group 1)
-        \]                                      # closing bracket
-        (?:\s*<<[^>]*>>)?                      # optional stereotype
-        (?:\s*\#[a-zA-Z0-9]+)?                 # optional color
-        (?:\s+as\s+(?:"([^"]+)"|([\w.$]+)))?  # alias with dots/unicode (groups 2, 3)
-    '''
-
-    for match in re.finditer(bracket_pattern, content, re.MULTILINE | re.VERBOSE):
+    if '[' not in content:
+        return
+
+    for match in BRACKET_COMPONENT_PATTERN.finditer(content):
         name = match.group(1).strip()
         alias_quoted = match.group(2)
         alias_unquoted = match.group(3)
@@ -318,20 +477,8 @@ def extract_interface_notation(
 
     Note: Does NOT match (*) activity markers.
     """
-    # Pattern: () followed by name - lollipop interface notation
-    # Matches: () "Name", () Name, ()Name
-    lollipop_pattern = r'''
-        ^\s*                                    # line start
-        \(\s*\)                                # empty parentheses ()
-        \s*                                    # optional whitespace
-        (?:
-            "([^"]+)"                          # quoted name (group 1)
-            |
-            ([\w.$]+)                          # unquoted name with dots/unicode (group 2)
-        )
-        (?:\s*<<[^>]*>>)?                      # optional stereotype
-        (?:\s+as\s+(?:"([^"]+)"|([\w.$]+)))?  # alias with dots/unicode (groups 3, 4)
-    '''
+    if '(' not in content:
+        return
 
     def add_interface(name: Optional[str], alias_quoted: Optional[str],
                       alias_unquoted: Optional[str]) -> None:
@@ -355,7 +502,7 @@ def extract_interface_notation(
             declared_names.add(alias_lower)
 
     # Extract lollipop notation: () Name, ()"Name", ()Name
-    for match in re.finditer(lollipop_pattern, content, re.MULTILINE | re.VERBOSE):
+    for match in LOLLIPOP_INTERFACE_PATTERN.finditer(content):
         name = match.group(1) if match.group(1) else match.group(2)
         add_interface(name, match.group(3), match.group(4))
 
@@ -375,18 +522,11 @@ def extract_usecase_parentheses(
 
     Note: Does NOT match (*) activity markers or () interface notation.
     """
-    # Pattern 1: (UseCase Name) with optional alias
-    # Must not match (*) or empty ()
-    usecase_pattern = r'''
-        (?:^|[\s\n])                           # line start or whitespace
-        \(                                     # opening paren
-        ([^()*\n][^)\n]*?)                     # usecase name - not starting with * or (
-        \)                                     # closing paren
-        (?:\s+as\s+\(([^)]+)\))?               # optional alias in parens
-        (?:\s+as\s+([\w.$]+))?                 # or plain alias with dots/unicode
-    '''
-
-    for match in re.finditer(usecase_pattern, content, re.MULTILINE | re.VERBOSE):
+    # Both patterns need a parenthesis
+    if '(' not in content:
+        return
+
+    for match in USECASE_PARENTHESES_PATTERN.finditer(content):
         name = match.group(1)
         if name:
             name = name.strip()
@@ -411,14 +551,7 @@ def extract_usecase_parentheses(
             alias_map[alias_lower] = name
             declared_names.add(alias_lower)
 
-    # Pattern 2: "Quoted Name" as (Identifier) - common in usecase diagrams
-    quoted_alias_pattern = r'''
-        "([^"]+)"                              # quoted name
-        \s+as\s+
-        \(([^)]+)\)                            # parenthesized identifier
-    '''
-
-    for match in re.finditer(quoted_alias_pattern, content, re.MULTILINE | re.VERBOSE):
+    for match in QUOTED_ALIAS_USECASE_PATTERN.finditer(content):
         name = match.group(1).strip()
         alias = match.group(2).strip()
 
@@ -453,17 +586,10 @@ def extract_creole_actor(
     - Sequence message labels (A -> B : message) - colon after arrow
     - Activity actions (:action;) - ends with semicolon
     """
-    # Pattern: :Name: with optional alias
-    # Must not be followed by semicolon (activity) or preceded by arrow (sequence)
-    actor_pattern = r'''
-        (?:^|(?<![->.]))                       # not preceded by arrow chars
-        \s*
-        :([^:\n;]+):                           # :name: - no colons, newlines, or semicolons inside
-        (?!\s*;)                               # not followed by semicolon (activity syntax)
-        (?:\s+as\s+([\w.$]+))?                 # optional alias with dots/unicode
-    '''
-
-    for match in re.finditer(actor_pattern, content, re.MULTILINE | re.VERBOSE):
+    if ':' not in content:
+        return
+
+    for match in CREOLE_ACTOR_PATTERN.finditer(content):
         name = match.group(1)
         if name:
             name = name.strip()
@@ -486,9 +612,23 @@ def extract_creole_actor(
             declared_names.add(alias_lower)
 
 
+def _is_cardinality_bound(part: str) -> bool:
+    """Check one side of a cardinality: a non-empty run of digits and '*'."""
+    if not part:
+        return False
+    digits = part.replace('*', '')
+    return not digits or digits.isdecimal()
+
+
 def is_cardinality(name: str) -> bool:
-    """Check if a string is a cardinality marker like '1', '*', '0..*', '1..*'."""
-    return bool(CARDINALITY_PATTERN.match(name.strip()))
+    """Check if a string is a cardinality marker like '1', '*', '0..*', '1..*'.
+
+    A marker is one or two runs of digits/'*' joined by '..'. Checked with
+    str methods rather than a regex since it runs for every relationship
+    endpoint; isdecimal() accepts exactly the characters regex \\d does.
+    """
+    lower, sep, upper = name.strip().partition('..')
+    return _is_cardinality_bound(lower) and (not sep or _is_cardinality_bound(upper))
 
 
 def get_name_from_groups(quoted: Optional[str], unquoted: Optional[str]) -> Optional[str]:
@@ -509,79 +649,11 @@ def extract_implicit(
     primary_type: str = 'class'
 ) -> None:
     """Extract implicit elements from relationship usage."""
-    # Main relationship pattern - covers class, component, deployment, etc.
-    # Supports both quoted and unquoted element names
-    # Note: Cardinality markers like "1", "*" are filtered by is_cardinality()
-    # Note: (*) is activity diagram start/end marker, matched but filtered out
-    # Structure: LEFT [CARDINALITY] ARROW [LABEL/CARDINALITY] RIGHT
-    relation_pattern = r'''
-        (?:^|\s)                               # line start or whitespace
-        (?:
-            "([^"]+)"                          # quoted left element (group 1)
-            |
-            ([\w.$]+)                          # unquoted left element with dots/unicode (group 2)
-            |
-            \(([^()*\n][^)\n]*)\)              # parenthesized usecase left (group 3)
-            |
-            \(\*\)                             # activity start/end marker (not captured)
-        )
-        (?:[ \t]*"[^"\n]*")?                   # optional cardinality after left (same line)
-        [ \t]*
-        (
-            # Async/special sequence (most specific first)
-            ->>|<<-                            # async message
-            |
-            ->x|x<-                            # lost/found message
-            |
-            <->                                # bidirectional
-            |
-            # Inheritance/realization with direction
-            (?:<\|)?[-.](?:up|down|left|right|u|d|l|r)?[-.][-.]?(?:\|>|>)?
-            |
-            (?:<)?[-.][-.]+(?:\|>|>)?
-            |
-            # Composition/aggregation/deployment endpoints
-            [*o#x+^0][-.][-.]+ | [-.][-.]+[*o#x+^0]
-            |
-            # Dotted dependency
-            \.\.+>|<\.\.+
-            |
-            # Simple arrows (single dash - common in sequence)
-            <-+|-+>
-        )
-        [ \t]*
-        (?:"[^"\n]*"[ \t]*)?                   # optional cardinality after arrow (same line)
-        (?:\[[^\]\n]*\][ \t]*)?                # optional bracket label [ OK ] (same line)
-        (?:
-            "([^"]+)"                          # quoted right element (group 5)
-            |
-            ([\w.$]+)                          # unquoted right element with dots/unicode (group 6)
-            |
-            \(([^()*\n][^)\n]*)\)              # parenthesized usecase right (group 7)
-            |
-            \(\*\)                             # activity start/end marker (not captured)
-        )
-    '''
-
-    # Sequence diagram message pattern: Alice -> Bob : message
-    # Supports both quoted and unquoted participant names
-    sequence_msg_pattern = r'''
-        ^\s*                                   # line start
-        (?:
-            "([^"]+)"                          # quoted left participant (group 1)
-            |
-            ([\w.$]+)                          # unquoted left participant with dots/unicode (group 2)
-        )
-        \s*
-        (<?-+>>?|<?\.+>?)                      # arrow (group 3)
-        \s*
-        (?:
-            "([^"]+)"                          # quoted right participant (group 4)
-            |
-            ([\w.$]+)                          # unquoted right participant with dots/unicode (group 5)
-        )
-        \s*:\s*                                # colon separator (sequence msg label)
-    '''
+    # Every arrow form in RELATION_PATTERN, the bracket relation patterns and
+    # SEQUENCE_MESSAGE_PATTERN contains '-' or '.' - without either there is
+    # no relationship to find
+    if '-' not in content and '.' not in content:
+        return
 
     def add_implicit_element(name: Optional[str]) -> None:
         """Helper to add an implicit element if valid."""
@@ -624,7 +696,7 @@ def extract_implicit(
         declared_names.add(name_lower)
 
     # Pass 1: Main relationship pattern (all diagram types)
-    for match in re.finditer(relation_pattern, content, re.VERBOSE):
+    for match in RELATION_PATTERN.finditer(content):
         # Left side: groups 1 (quoted), 2 (unquoted), 3 (parenthesized)
         left_name = match.group(1) or match.group(2) or match.group(3)
         # Right side: groups 5 (quoted), 6 (unquoted), 7 (parenthesized)
@@ -635,17 +707,15 @@ def extract_implicit(
             add_implicit_element(right_name.strip())
 
     # Pass 1b: Bracket notation in relationships: [A] --> [B]
-    bracket_relation_pattern = r'\[([^\]]+)\]\s*(?:--?>|<--?|\.\.>|<\.\.|\*--|--\*|o--|--o)'
-    for match in re.finditer(bracket_relation_pattern, content):
+    for match in BRACKET_RELATION_LEFT_PATTERN.finditer(content):
         add_bracket_component(match.group(1))
     # Also check for right side brackets after arrows
-    bracket_right_pattern = r'(?:--?>|<--?|\.\.>|<\.\.|\*--|--\*|o--|--o)\s*\[([^\]]+)\]'
-    for match in re.finditer(bracket_right_pattern, content):
+    for match in BRACKET_RELATION_RIGHT_PATTERN.finditer(content):
         add_bracket_component(match.group(1))
 
     # Pass 2: Sequence message pattern (sequence diagrams only)
     if primary_type == 'sequence':
-        for match in re.finditer(sequence_msg_pattern, content, re.VERBOSE | re.MULTILINE):
+        for match in SEQUENCE_MESSAGE_PATTERN.finditer(content):
             left_name = get_name_from_groups(match.group(1), match.group(2))
             right_name = get_name_from_groups(match.group(4), match.group(5))
             add_implicit_element(left_name)
@@ -684,7 +754,8 @@ def count_elements(content: str, primary_type: str = 'class') -> Dict[str, int]:
 
     # :Actor: syntax - usecase and sequence diagrams (both use actors)
     # Use stripped content to avoid false matches on method signatures like id:string
-    if primary_type in ('usecase', 'sequence'):
+    # (stripping only removes text, so no ':' in content means no actor to find)
+    if primary_type in ('usecase', 'sequence') and ':' in content:
         content_without_bodies = strip_member_bodies(content)
         extract_creole_actor(content_without_bodies, elements, declared_names, alias_map)
 
@@ -707,8 +778,13 @@ def load_classifications(path: Path) -> Dict[str, Any]:
 def read_puml_file(path: Path) -> Optional[str]:
     """Read a PlantUML file."""
     try:
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            return f.read()
+        # Decode in one shot rather than through the text-mode reader, and
+        # only do universal-newline translation when a \r is present
+        with open(path, 'rb') as f:
+            content = f.read().decode('utf-8', errors='replace')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
     except Exception as e:
         print(f"Warning: Could not read {path}: {e}", file=sys.stderr)
         return None
@@ -731,6 +807,39 @@ def process_file(
     }
 
 
+def count_file(
+    filepath: Path,
+    primary_type: str,
+    confidence: Optional[float],
+    diagram_types: List[str],
+) -> Dict[str, Any]:
+    """Read and process one file, recording why it was skipped if unreadable."""
+    if not filepath.exists():
+        return {
+            "primary_type": "",
+            "confidence": None,
+            "diagram_types": [],
+            "elements": {},
+            "total_elements": 0,
+            "note": "file not found"
+        }
+
+    content = read_puml_file(filepath)
+    if content is None:
+        return {
+            "primary_type": "",
+            "confidence": None,
+            "diagram_types": [],
+            "elements": {},
+            "total_elements": 0,
+            "note": "read error"
+        }
+
+    result = process_file(content, primary_type, diagram_types)
+    result["confidence"] = confidence
+    return result
+
+
 def aggregate_statistics(
     results: Dict[str, Dict],
     start_time: datetime,
@@ -741,12 +850,12 @@ def aggregate_statistics(
     with_elements = sum(1 for r in results.values() if r["total_elements"] > 0)
     elements_total = sum(r["total_elements"] for r in results.values())
 
-    by_element_type: Dict[str, int] = {}
+    by_element_type: Counter = Counter()
     for result in results.values():
-        for elem_type, count in result["elements"].items():
-            by_element_type[elem_type] = by_element_type.get(elem_type, 0) + count
+        by_element_type.update(result["elements"])
 
-    by_element_type = dict(sorted(by_element_type.items(), key=lambda x: -x[1]))
+    # most_common() sorts stably, so equal counts keep first-seen order as before
+    by_element_type = dict(by_element_type.most_common())
 
     duration = end_time - start_time
     processing_time = str(duration).split('.')[0]
@@ -765,6 +874,7 @@ def process_directory(
     classifications_path: Path,
     puml_dir: Path,
     output_path: Path,
+    jobs: int = 1,
 ) -> Dict[str, Any]:
     """Process all files from classification JSON."""
     start_time = datetime.now()
@@ -775,50 +885,33 @@ def process_directory(
 
     print(f"Using unified element counter v{VERSION}")
 
-    results: Dict[str, Dict] = {}
     files_to_process = list(classifications.items())
-
-    print(f"Processing {len(files_to_process)} files...")
-
-    if HAS_TQDM:
-        iterator = tqdm(files_to_process, desc="Counting elements")
-    else:
-        iterator = files_to_process
-
-    for filename, classification in iterator:
-        filepath = puml_dir / filename
-
-        if not filepath.exists():
-            results[filename] = {
-                "primary_type": "",
-                "confidence": None,
-                "diagram_types": [],
-                "elements": {},
-                "total_elements": 0,
-                "note": "file not found"
-            }
-            continue
-
-        content = read_puml_file(filepath)
-        if content is None:
-            results[filename] = {
-                "primary_type": "",
-                "confidence": None,
-                "diagram_types": [],
-                "elements": {},
-                "total_elements": 0,
-                "note": "read error"
-            }
-            continue
-
+    filepaths: List[Path] = []
+    primary_types: List[str] = []
+    confidences: List[Optional[float]] = []
+    diagram_types_list: List[List[str]] = []
+    for filename, classification in files_to_process:
         primary_type = classification.get("primary_type", "class")
-        confidence = classification.get("confidence")
         diagram_types = list(classification.get("types", {}).keys())
         if not diagram_types:
             diagram_types = [primary_type]
+        filepaths.append(puml_dir / filename)
+        primary_types.append(primary_type)
+        confidences.append(classification.get("confidence"))
+        diagram_types_list.append(diagram_types)
+
+    print(f"Processing {len(files_to_process)} files...")
+
+    # Files are independent, so spread the regex work across processes;
+    # map() keeps results in input order
+    task_args = (filepaths, primary_types, confidences, diagram_types_list)
+    file_results = map_jobs(count_file, *task_args, jobs=jobs, chunksize=64)
+
+    if HAS_TQDM:
+        file_results = tqdm(file_results, total=len(filepaths), desc="Counting elements")
 
-        result = process_file(content, primary_type, diagram_types)
-        result["confidence"] = confidence
+    results: Dict[str, Dict] = {}
+    for result, (filename, _) in zip(file_results, files_to_process):
         results[filename] = result
 
     end_time = datetime.now()
@@ -838,8 +931,13 @@ def process_directory(
     }
 
     print(f"Writing results to {output_path}...")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if HAS_ORJSON:
+        # Same layout as json.dump(indent=2, ensure_ascii=False), serialized in C
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
 
     print("\n=== Summary ===")
     print(f"Total files: {statistics['total_files']}")
@@ -886,6 +984,13 @@ def main():
         help="Output JSON file path (default: element_counts.json)"
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)"
+    )
+
     args = parser.parse_args()
 
     if not args.classifications.exists():
@@ -900,6 +1005,7 @@ def main():
         args.classifications,
         args.puml_dir,
         args.output,
+        args.jobs,
     )
 
 
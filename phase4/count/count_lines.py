@@ -16,13 +16,32 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import sys
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from tqdm import tqdm
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Import shared process-pool helper
+import sys as _sys
+_sys.path.insert(0, str(Path(__file__).parent.parent))
+from common.parallel import map_jobs
+
+
+# Compiled patterns used by count_loc() for every file/line
+MULTILINE_COMMENT_PATTERN = re.compile(r"/'.*?'/", re.DOTALL)
+START_END_MARKER_PATTERN = re.compile(r'^\s*@(?:start|end)uml\s*$', re.IGNORECASE)
+INLINE_COMMENT_MARKER_PATTERN = re.compile(r"^'|(?<=[ \t])'(?![^ \t])")
+
 
 def remove_inline_comment(line: str) -> str:
     """
@@ -39,57 +58,20 @@ def remove_inline_comment(line: str) -> str:
     Returns:
         Line with comment removed
     """
-    result = []
-    in_string = False
-    i = 0
-
-    while i < len(line):
-        char = line[i]
-
-        # Toggle string state on double-quote
-        if char == '"':
-            in_string = not in_string
-            result.append(char)
-            i += 1
-
-        # Check for comment marker
-        elif char == "'" and not in_string:
-            # Comment rules: ' starts a comment if:
-            # 1. At start of line (already handled by regex)
-            # 2. Preceded by whitespace AND followed by space/tab (typical comment)
-            # 3. Preceded by whitespace AND at end of line
-            # Otherwise, preserve it (could be 'text' or Alice's)
-
-            if i == 0:
-                # At start of line (but this should be caught by regex already)
-                break
-            elif result and result[-1] in (' ', '\t'):
-                # Preceded by whitespace - check what follows
-                if i + 1 >= len(line):
-                    # At end of line after whitespace → comment
-                    while result and result[-1] in (' ', '\t'):
-                        result.pop()
-                    break
-                elif line[i + 1] in (' ', '\t'):
-                    # Followed by space/tab → comment
-                    while result and result[-1] in (' ', '\t'):
-                        result.pop()
-                    break
-                else:
-                    # Preceded by space but not followed by space ('text' pattern)
-                    result.append(char)
-                    i += 1
-            else:
-                # In middle of word (e.g., "Alice's") → NOT a comment
-                result.append(char)
-                i += 1
-
-        # Normal character
-        else:
-            result.append(char)
-            i += 1
+    # Most lines have no apostrophe at all
+    if "'" not in line:
+        return line
+
+    # Candidate markers: ' at line start, or ' after whitespace that is
+    # followed by whitespace/end of line ('text' and Alice's don't match).
+    # A candidate is a comment only outside double-quoted strings, i.e. when
+    # an even number of quotes precedes it.
+    for match in INLINE_COMMENT_MARKER_PATTERN.finditer(line):
+        start = match.start()
+        if line.count('"', 0, start) % 2 == 0:
+            return line[:start].rstrip(' \t')
 
-    return ''.join(result)
+    return line
 
 
 def count_loc(puml_content: str) -> Dict[str, int]:
@@ -113,40 +95,48 @@ def count_loc(puml_content: str) -> Dict[str, int]:
             'comment_lines': int,    # Pure comment lines
         }
     """
-    lines = puml_content.split('\n')
-    total_lines = len(lines)
+    total_lines = puml_content.count('\n') + 1
 
-    # Skip metadata header (first 3 lines if they're all comments)
-    if len(lines) >= 3 and all(line.strip().startswith("'") for line in lines[:3]):
-        lines = lines[3:]
+    # Skip metadata header (first 3 lines if they're all comments); only the
+    # header lines are split off, the rest stays one string
+    content = puml_content
+    if total_lines >= 3:
+        head = puml_content.split('\n', 3)
+        if all(line.strip().startswith("'") for line in head[:3]):
+            content = head[3] if len(head) > 3 else ''
 
     # Remove multi-line comments: /' ... '/
-    content = '\n'.join(lines)
-    content = re.sub(r"/'.*?'/", "", content, flags=re.DOTALL)
+    if "/'" in content:
+        content = MULTILINE_COMMENT_PATTERN.sub("", content)
     lines = content.split('\n')
 
+    # Without any apostrophe there are no comments left to strip, so every
+    # non-blank, non-marker line is code
+    has_comments = "'" in content
+
     loc = 0
     blank_lines = 0
     comment_lines = 0
 
     for line in lines:
-        # Skip @startuml/@enduml markers
-        if re.match(r'^\s*@(start|end)uml\s*$', line, re.IGNORECASE):
-            continue
-
         # Count blank lines
-        if not line.strip():
+        stripped = line.strip()
+        if not stripped:
             blank_lines += 1
             continue
 
-        # Count pure comment lines
-        if re.match(r"^\s*'+", line):
+        # Skip @startuml/@enduml markers
+        if stripped[0] == '@' and START_END_MARKER_PATTERN.match(line):
+            continue
+
+        # Count pure comment lines (^\s*' - str.strip() drops exactly the
+        # characters \s matches)
+        if stripped[0] == "'":
             comment_lines += 1
             continue
 
         # Has code - remove inline comment and verify content exists
-        cleaned = remove_inline_comment(line)
-        if cleaned.strip():
+        if not has_comments or remove_inline_comment(line).strip():
             loc += 1
 
     return {
@@ -175,6 +165,52 @@ def find_puml_file(filename: str, search_dirs: List[Path]) -> Optional[Path]:
     return None
 
 
+def build_puml_index(search_dirs: List[Path]) -> Dict[str, Path]:
+    """
+    Map PUML filenames to their path in the first search directory containing them.
+
+    Args:
+        search_dirs: List of directories to index, in priority order
+
+    Returns:
+        Dictionary of filename -> path
+    """
+    index: Dict[str, Path] = {}
+    for search_dir in search_dirs:
+        try:
+            entries = list(os.scandir(search_dir))
+        except OSError:
+            continue
+        for entry in entries:
+            if not entry.name.endswith('.puml') or entry.name in index:
+                continue
+            # Dangling symlinks don't count as existing, same as find_puml_file()
+            if entry.is_symlink() and not os.path.exists(entry.path):
+                continue
+            index[entry.name] = search_dir / entry.name
+    return index
+
+
+def read_puml_file(path: Path) -> str:
+    """
+    Read a PUML file as text with universal newlines.
+
+    Decodes the raw bytes in one call instead of going through the text-mode
+    reader; the newline translation only runs when a \r is present.
+
+    Args:
+        path: Path to PUML file
+
+    Returns:
+        File content
+    """
+    with open(path, 'rb') as f:
+        content = f.read().decode('utf-8', errors='replace')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
 def compute_statistics(values: List[float]) -> Dict[str, float]:
     """
     Compute statistical metrics for a list of values.
@@ -208,7 +244,36 @@ def compute_statistics(values: List[float]) -> Dict[str, float]:
     }
 
 
-def process_json_file(input_path: Path, puml_dirs: List[Path], verbose: bool = False) -> Dict:
+def count_file_loc(
+    filename: str,
+    puml_path: Optional[Path],
+    puml_dirs: List[Path],
+) -> Tuple[Optional[Dict[str, int]], Optional[str]]:
+    """
+    Find, read and count LOC for a single PUML file.
+
+    Args:
+        filename: Name of the PUML file
+        puml_path: Path from the directory index, or None to search puml_dirs
+        puml_dirs: List of directories containing PUML files
+
+    Returns:
+        Tuple of (LOC metrics or None if not found, error message or None)
+    """
+    try:
+        if not puml_path:
+            puml_path = find_puml_file(filename, puml_dirs)
+        if not puml_path:
+            return None, None
+
+        content = read_puml_file(puml_path)
+        return count_loc(content), None
+
+    except Exception as e:
+        return None, str(e)
+
+
+def process_json_file(input_path: Path, puml_dirs: List[Path], verbose: bool = False, jobs: int = 1) -> Dict:
     """
     Process classification JSON and add LOC metrics.
 
@@ -216,14 +281,19 @@ def process_json_file(input_path: Path, puml_dirs: List[Path], verbose: bool = F
         input_path: Path to input JSON file
         puml_dirs: List of directories containing PUML files
         verbose: Show progress bar if True
+        jobs: Number of worker processes used for reading and counting
 
     Returns:
         Updated JSON data with LOC metrics
     """
     # Load input JSON
     print(f"Loading classification JSON from: {input_path}")
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if HAS_ORJSON:
+        with open(input_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     classifications = data.get('classifications', {})
     total_files = len(classifications)
@@ -234,24 +304,36 @@ def process_json_file(input_path: Path, puml_dirs: List[Path], verbose: bool = F
     skipped = 0
     errors = 0
 
-    iterator = tqdm(classifications.items(), desc="Adding LOC metrics") if verbose else classifications.items()
+    # File lookup, reading and counting are independent per file, so they
+    # run in worker processes; map() keeps results in input order
+    filenames = list(classifications)
+    puml_index = build_puml_index(puml_dirs)
+    puml_paths = [puml_index.get(filename) for filename in filenames]
+    results = map_jobs(
+        count_file_loc, filenames, puml_paths, [puml_dirs] * total_files,
+        jobs=jobs, chunksize=64,
+    )
 
-    for filename, classification in iterator:
-        try:
-            # Find PUML file
-            puml_path = find_puml_file(filename, puml_dirs)
-            if not puml_path:
-                skipped += 1
-                if verbose:
-                    print(f"Warning: PUML file not found: {filename}")
-                continue
+    if verbose:
+        results = tqdm(
+            results, total=total_files, desc="Adding LOC metrics",
+            mininterval=0.5, smoothing=0,
+        )
 
-            # Read content
-            content = puml_path.read_text(encoding='utf-8', errors='replace')
+    for (loc_metrics, error), (filename, classification) in zip(results, classifications.items()):
+        if error is not None:
+            errors += 1
+            if verbose:
+                print(f"Error processing {filename}: {error}")
+            continue
 
-            # Count LOC
-            loc_metrics = count_loc(content)
+        if loc_metrics is None:
+            skipped += 1
+            if verbose:
+                print(f"Warning: PUML file not found: {filename}")
+            continue
 
+        try:
             # Add metrics to classification
             classification['loc'] = loc_metrics['loc']
             classification['total_lines'] = loc_metrics['total_lines']
@@ -281,15 +363,18 @@ def process_json_file(input_path: Path, puml_dirs: List[Path], verbose: bool = F
         if 'statistics' not in data:
             data['statistics'] = {}
 
-        data['statistics']['loc_statistics'] = compute_statistics(all_locs)
+        # Sort once: compute_statistics() re-sorting an already sorted list
+        # is linear, and the distribution buckets become bisections
+        sorted_locs = sorted(all_locs)
+        data['statistics']['loc_statistics'] = compute_statistics(sorted_locs)
 
         # Add LOC distribution
         distribution = {
-            '1-10': sum(1 for loc in all_locs if 1 <= loc <= 10),
-            '11-50': sum(1 for loc in all_locs if 11 <= loc <= 50),
-            '51-100': sum(1 for loc in all_locs if 51 <= loc <= 100),
-            '101-200': sum(1 for loc in all_locs if 101 <= loc <= 200),
-            '201+': sum(1 for loc in all_locs if loc > 200)
+            '1-10': bisect_right(sorted_locs, 10) - bisect_left(sorted_locs, 1),
+            '11-50': bisect_right(sorted_locs, 50) - bisect_left(sorted_locs, 11),
+            '51-100': bisect_right(sorted_locs, 100) - bisect_left(sorted_locs, 51),
+            '101-200': bisect_right(sorted_locs, 200) - bisect_left(sorted_locs, 101),
+            '201+': len(sorted_locs) - bisect_right(sorted_locs, 200)
         }
         data['statistics']['loc_distribution'] = distribution
 
@@ -357,6 +442,13 @@ Examples:
         help='Show progress bar and detailed output'
     )
 
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Number of worker processes (default: 1)'
+    )
+
     args = parser.parse_args()
 
     # Validate input file
@@ -375,12 +467,17 @@ Examples:
 
     # Process JSON
     try:
-        data = process_json_file(args.input, args.puml_dirs, args.verbose)
+        data = process_json_file(args.input, args.puml_dirs, args.verbose, args.jobs)
 
         # Save output
         print(f"\nSaving output to: {args.output}")
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        if HAS_ORJSON:
+            # Same layout as json.dump(indent=2, ensure_ascii=False), serialized in C
+            with open(args.output, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
         print("Done!")
 
@@ -27,10 +27,17 @@ try:
 except ImportError:
     HAS_TQDM = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import shared preprocessing utilities
 import sys as _sys
 _sys.path.insert(0, str(Path(__file__).parent.parent))
 from common.preprocessing import preprocess_content
+from common.parallel import map_jobs
 
 
 # =============================================================================
@@ -85,8 +92,11 @@ ARROW_PATTERNS = [
     r'-+>(?!>)',                # --> (not ->>)
 ]
 
-# Compiled pattern for efficiency
-ARROW_REGEX = re.compile('|'.join(f'({p})' for p in ARROW_PATTERNS))
+# Compiled pattern for efficiency (non-capturing, so findall() returns strings)
+ARROW_REGEX = re.compile('|'.join(f'(?:{p})' for p in ARROW_PATTERNS))
+
+# Directive lines (@startuml, !theme, ...) are not scanned for arrows
+DIRECTIVE_LINE_PATTERN = re.compile(r'^[^\S\n]*[@!].*', re.MULTILINE)
 
 
 # =============================================================================
@@ -108,25 +118,13 @@ def count_arrows(content: str) -> int:
     Returns:
         Total count of arrows found
     """
-    total = 0
-
-    for line in content.split('\n'):
-        line = line.strip()
-        if not line:
-            continue
-
-        # Skip directive lines
-        if line.startswith('@') or line.startswith('!'):
-            continue
-
-        # Find all arrow matches in this line
-        matches = ARROW_REGEX.findall(line)
-        # findall returns tuples for groups, count non-empty matches
-        for match_tuple in matches:
-            if any(match_tuple):
-                total += 1
+    # Skip directive lines
+    if '@' in content or '!' in content:
+        content = DIRECTIVE_LINE_PATTERN.sub('', content)
 
-    return total
+    # Arrows never contain a newline, so one scan over the whole content
+    # finds the same matches as scanning each line separately
+    return len(ARROW_REGEX.findall(content))
 
 
 def count_relationships(content: str, primary_type: str) -> Dict[str, int]:
@@ -165,16 +163,41 @@ def load_element_counts(path: Path) -> Dict[str, Any]:
 def read_puml_file(path: Path) -> Optional[str]:
     """Read a PlantUML file."""
     try:
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            return f.read()
+        # Decode in one shot rather than through the text-mode reader, and
+        # only do universal-newline translation when a \r is present
+        with open(path, 'rb') as f:
+            content = f.read().decode('utf-8', errors='replace')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
     except Exception as e:
         print(f"Warning: Could not read {path}: {e}", file=sys.stderr)
         return None
 
 
+def count_file_relationships(filepath: Path, primary_type: str) -> Optional[Dict[str, int]]:
+    """
+    Read one file and count its relationships.
+
+    Args:
+        filepath: Path to the .puml file
+        primary_type: Primary diagram type from classification
+
+    Returns:
+        Category -> count mapping, or None if the file does not exist
+    """
+    if not filepath.exists():
+        return None
+    content = read_puml_file(filepath)
+    if not content:
+        return {}
+    return count_relationships(content, primary_type)
+
+
 def process_files(
     element_counts_path: Path,
     puml_dir: Path,
+    jobs: int = 1,
 ) -> Dict[str, Any]:
     """
     Process all files and merge element counts with relationship counts.
@@ -182,6 +205,7 @@ def process_files(
     Args:
         element_counts_path: Path to element_counts.json
         puml_dir: Directory containing .puml files
+        jobs: Number of worker processes used for counting
 
     Returns:
         Merged results dictionary
@@ -198,19 +222,26 @@ def process_files(
     merged_results: Dict[str, Dict] = {}
     relationship_stats: Dict[str, int] = {}
     total_relationships = 0
+    files_with_relationships = 0
 
     files_to_process = list(element_results.items())
 
     print(f"Processing {len(files_to_process)} files for relationships...")
 
-    if HAS_TQDM:
-        iterator = tqdm(files_to_process, desc="Counting relationships")
-    else:
-        iterator = files_to_process
+    filepaths = [puml_dir / filename for filename, _ in files_to_process]
+    primary_types = [elem_result.get("primary_type", "class") for _, elem_result in files_to_process]
 
-    for idx, (filename, elem_result) in enumerate(iterator):
-        filepath = puml_dir / filename
+    # Files are independent, so spread the regex work across processes;
+    # map() keeps results in input order
+    file_counts = map_jobs(count_file_relationships, filepaths, primary_types, jobs=jobs, chunksize=64)
 
+    if HAS_TQDM:
+        file_counts = tqdm(
+            file_counts, total=len(files_to_process), desc="Counting relationships",
+            mininterval=0.5, smoothing=0,
+        )
+
+    for idx, (rel_counts, (filename, elem_result)) in enumerate(zip(file_counts, files_to_process)):
         # Start with element data
         merged = {
             "primary_type": elem_result.get("primary_type", ""),
@@ -220,22 +251,17 @@ def process_files(
             "total_elements": elem_result.get("total_elements", 0),
         }
 
-        # Count relationships
-        if filepath.exists():
-            content = read_puml_file(filepath)
-            if content:
-                primary_type = elem_result.get("primary_type", "class")
-                rel_counts = count_relationships(content, primary_type)
-                merged["relationships"] = rel_counts
-                merged["total_relationships"] = sum(rel_counts.values())
-
-                # Update statistics
-                total_relationships += merged["total_relationships"]
-                for cat, count in rel_counts.items():
-                    relationship_stats[cat] = relationship_stats.get(cat, 0) + count
-            else:
-                merged["relationships"] = {}
-                merged["total_relationships"] = 0
+        # Relationship counts (None when the file is missing)
+        if rel_counts is not None:
+            merged["relationships"] = rel_counts
+            merged["total_relationships"] = sum(rel_counts.values())
+
+            # Update statistics
+            total_relationships += merged["total_relationships"]
+            if merged["total_relationships"] > 0:
+                files_with_relationships += 1
+            for cat, count in rel_counts.items():
+                relationship_stats[cat] = relationship_stats.get(cat, 0) + count
         else:
             merged["relationships"] = {}
             merged["total_relationships"] = 0
@@ -254,9 +280,7 @@ def process_files(
     # Build statistics
     statistics = {
         "total_files": len(merged_results),
-        "files_with_relationships": sum(
-            1 for r in merged_results.values() if r["total_relationships"] > 0
-        ),
+        "files_with_relationships": files_with_relationships,
         "total_relationships": total_relationships,
         "by_category": dict(sorted(relationship_stats.items(), key=lambda x: -x[1])),
         "processing_time": processing_time,
@@ -309,6 +333,13 @@ def main():
         help="Output JSON file path (default: analysis_complete.json)"
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)"
+    )
+
     args = parser.parse_args()
 
     if not args.element_counts.exists():
@@ -320,12 +351,17 @@ def main():
         sys.exit(1)
 
     # Process files
-    output = process_files(args.element_counts, args.puml_dir)
+    output = process_files(args.element_counts, args.puml_dir, args.jobs)
 
     # Write output
     print(f"\nWriting results to {args.output}...")
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if HAS_ORJSON:
+        # Same layout as json.dump(indent=2, ensure_ascii=False), serialized in C
+        with open(args.output, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
 
     # Print summary
     stats = output["statistics"]
@@ -15,9 +15,13 @@ Usage:
 import argparse
 import json
 import sys
-from datetime import datetime
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from itertools import chain, repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
 # Optional tqdm for progress bar
 try:
@@ -26,6 +30,18 @@ try:
 except ImportError:
     HAS_TQDM = False
 
+# Optional orjson for faster JSON load/dump
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Import shared process-pool helper
+import sys as _sys
+_sys.path.insert(0, str(Path(__file__).parent.parent))
+from common.parallel import map_jobs
+
 # =============================================================================
 # CONSTANTS
 # =============================================================================
@@ -95,6 +111,19 @@ EXPECTED_ELEMENTS = {
     }
 }
 
+# Forbidden elements per diagram type as sets, for the FORBIDDEN_ELEMENTS
+# check in detect_flags()
+FORBIDDEN_ELEMENT_SETS = {
+    dtype: frozenset(expected['forbidden'])
+    for dtype, expected in EXPECTED_ELEMENTS.items()
+}
+
+# Category order used by tally_elements()
+ELEMENT_CATEGORIES = ('primary', 'allowed', 'forbidden')
+
+# (total_elements, {diagram_type: (primary, allowed, forbidden) counts})
+Tally = Tuple[int, Dict[str, Sequence[int]]]
+
 # Severity ordering for filtering
 SEVERITY_ORDER = {'error': 3, 'warning': 2, 'info': 1}
 
@@ -103,9 +132,53 @@ SEVERITY_ORDER = {'error': 3, 'warning': 2, 'info': 1}
 # CORE VALIDATION FUNCTIONS
 # =============================================================================
 
+def build_element_membership() -> Dict[str, List[Tuple[str, int]]]:
+    """
+    Invert EXPECTED_ELEMENTS into element type -> [(diagram type, category index)].
+
+    Returns:
+        Dictionary mapping each listed element type to the diagram types and
+        ELEMENT_CATEGORIES indices it belongs to
+    """
+    membership: Dict[str, List[Tuple[str, int]]] = {}
+    for dtype, expected in EXPECTED_ELEMENTS.items():
+        for idx, category in enumerate(ELEMENT_CATEGORIES):
+            for name in expected[category]:
+                membership.setdefault(name, []).append((dtype, idx))
+    return membership
+
+
+ELEMENT_MEMBERSHIP = build_element_membership()
+
+
+def tally_elements(elements: Dict[str, int]) -> Tally:
+    """
+    Count a file's elements overall and per diagram type category in one pass.
+
+    Args:
+        elements: Dictionary mapping element type to count
+
+    Returns:
+        Tuple of (total_elements, {diagram_type: [primary, allowed, forbidden]})
+    """
+    category_counts = {dtype: [0, 0, 0] for dtype in EXPECTED_ELEMENTS}
+    total_elements = 0
+    for element, count in elements.items():
+        total_elements += count
+        for dtype, idx in ELEMENT_MEMBERSHIP.get(element, ()):
+            category_counts[dtype][idx] += count
+    return total_elements, category_counts
+
+
+# Tally of a file without elements (library, sprite and flow-only files),
+# shared instead of being rebuilt for each of them
+EMPTY_TALLY: Tally = (0, {dtype: (0, 0, 0) for dtype in EXPECTED_ELEMENTS})
+
+
 def calculate_consistency_score(
     primary_type: str,
-    elements: Dict[str, int]
+    elements: Dict[str, int],
+    tally: Optional[Tally] = None
 ) -> float:
     """
     Calculate consistency score (0.0 - 1.0) based on element alignment.
@@ -118,22 +191,23 @@ def calculate_consistency_score(
     Args:
         primary_type: Classified diagram type
         elements: Dictionary mapping element type to count
+        tally: Result of tally_elements(elements), computed if not given
 
     Returns:
         Consistency score between 0.0 and 1.0
     """
+    if tally is None:
+        tally = tally_elements(elements)
+    total_elements, category_counts = tally
+
     # Handle unclassified diagrams (library files, sprites, etc.)
     # These have no features detected, so 0 elements is expected and consistent
     if primary_type == 'unclassified':
-        total_elements = sum(elements.values())
         return 1.0 if total_elements == 0 else 0.3
 
     if primary_type not in EXPECTED_ELEMENTS:
         return 0.0
 
-    expected = EXPECTED_ELEMENTS[primary_type]
-    total_elements = sum(elements.values())
-
     if total_elements == 0:
         # No elements - score depends on diagram type
         # Activity diagrams use flow syntax (:action;, start/stop, swimlanes)
@@ -147,9 +221,7 @@ def calculate_consistency_score(
             return 0.3
 
     # Calculate element counts by category
-    primary_count = sum(elements.get(e, 0) for e in expected['primary'])
-    allowed_count = sum(elements.get(e, 0) for e in expected['allowed'])
-    forbidden_count = sum(elements.get(e, 0) for e in expected['forbidden'])
+    primary_count, allowed_count, forbidden_count = category_counts[primary_type]
 
     # Alignment score: primary + allowed vs total
     alignment_score = (primary_count + allowed_count) / total_elements
@@ -170,12 +242,16 @@ def calculate_consistency_score(
     return round(score, 4)
 
 
-def infer_type_from_elements(elements: Dict[str, int]) -> Tuple[str, float]:
+def infer_type_from_elements(
+    elements: Dict[str, int],
+    tally: Optional[Tally] = None
+) -> Tuple[str, float]:
     """
     Suggest correct diagram type based on element composition.
 
     Args:
         elements: Dictionary mapping element type to count
+        tally: Result of tally_elements(elements), computed if not given
 
     Returns:
         Tuple of (suggested_type, confidence)
@@ -183,18 +259,23 @@ def infer_type_from_elements(elements: Dict[str, int]) -> Tuple[str, float]:
     if not elements:
         return ('unknown', 0.0)
 
-    total = sum(elements.values())
+    if tally is None:
+        tally = tally_elements(elements)
+    total, category_counts = tally
     scores: Dict[str, float] = {}
 
-    for dtype, expected in EXPECTED_ELEMENTS.items():
-        primary_count = sum(elements.get(e, 0) for e in expected['primary'])
-        forbidden_count = sum(elements.get(e, 0) for e in expected['forbidden'])
+    for dtype, (primary_count, _, forbidden_count) in category_counts.items():
+        # Types without any primary element always score 0, which changes
+        # neither the best type nor the score total, so only candidate
+        # types (in EXPECTED_ELEMENTS order) are scored
+        if not primary_count:
+            continue
 
         # Score based on primary element ratio minus forbidden penalty
         score = (primary_count / total) - (forbidden_count / total * 0.5)
         scores[dtype] = max(0, score)
 
-    if max(scores.values()) == 0:
+    if not scores or max(scores.values()) == 0:
         return ('unknown', 0.0)
 
     best_type = max(scores, key=scores.get)
@@ -213,7 +294,8 @@ def detect_flags(
     elements: Dict[str, int],
     consistency_score: float,
     suggested_type: str,
-    suggestion_confidence: float
+    suggestion_confidence: float,
+    tally: Optional[Tally] = None
 ) -> List[Dict[str, Any]]:
     """
     Detect validation flags based on analysis results.
@@ -225,12 +307,15 @@ def detect_flags(
         consistency_score: Calculated consistency score
         suggested_type: Inferred type from elements
         suggestion_confidence: Confidence of type inference
+        tally: Result of tally_elements(elements), computed if not given
 
     Returns:
         List of flag dictionaries with code, severity, and details
     """
+    if tally is None:
+        tally = tally_elements(elements)
+    total_elements, category_counts = tally
     flags = []
-    total_elements = sum(elements.values())
 
     # NO_ELEMENTS check
     # Skip for activity diagrams - they use flow syntax rather than declared elements
@@ -244,10 +329,8 @@ def detect_flags(
             })
         return flags  # Can't do further element analysis
 
-    expected = EXPECTED_ELEMENTS.get(primary_type, {})
-
     # FORBIDDEN_ELEMENTS check
-    forbidden = expected.get('forbidden', [])
+    forbidden = FORBIDDEN_ELEMENT_SETS.get(primary_type, frozenset())
     found_forbidden = {e: c for e, c in elements.items() if e in forbidden}
     if found_forbidden:
         flags.append({
@@ -257,8 +340,8 @@ def detect_flags(
         })
 
     # MISSING_PRIMARY_ELEMENTS check
-    primary = expected.get('primary', [])
-    primary_count = sum(elements.get(e, 0) for e in primary)
+    primary = EXPECTED_ELEMENTS.get(primary_type, {}).get('primary', [])
+    primary_count = category_counts[primary_type][0] if primary else 0
     if primary_count == 0 and primary:
         primary_preview = primary[:3]
         flags.append({
@@ -326,14 +409,15 @@ def validate_file(entry: Dict[str, Any], threshold: float) -> Dict[str, Any]:
     if confidence is None:
         confidence = 0.0
 
-    # Calculate metrics
-    consistency_score = calculate_consistency_score(primary_type, elements)
-    suggested_type, suggestion_confidence = infer_type_from_elements(elements)
+    # Calculate metrics (one pass over elements shared by all three helpers)
+    tally = tally_elements(elements) if elements else EMPTY_TALLY
+    consistency_score = calculate_consistency_score(primary_type, elements, tally)
+    suggested_type, suggestion_confidence = infer_type_from_elements(elements, tally)
 
     # Detect flags
     flags = detect_flags(
         primary_type, confidence, elements,
-        consistency_score, suggested_type, suggestion_confidence
+        consistency_score, suggested_type, suggestion_confidence, tally
     )
 
     # Determine if consistent
@@ -344,7 +428,7 @@ def validate_file(entry: Dict[str, Any], threshold: float) -> Dict[str, Any]:
         'primary_type': primary_type,
         'confidence': confidence,
         'elements': elements,
-        'total_elements': sum(elements.values()),
+        'total_elements': tally[0],
         'consistency_score': consistency_score,
         'suggested_type': suggested_type,
         'suggestion_confidence': suggestion_confidence,
@@ -382,8 +466,7 @@ def build_confusion_matrix(results: Dict[str, Dict]) -> Dict[str, Dict[str, int]
 def generate_statistics(
     results: Dict[str, Dict],
     threshold: float,
-    start_time: datetime,
-    end_time: datetime
+    elapsed_seconds: float
 ) -> Dict[str, Any]:
     """
     Generate summary statistics from validation results.
@@ -391,81 +474,88 @@ def generate_statistics(
     Args:
         results: Validation results dictionary
         threshold: Consistency threshold used
-        start_time: Processing start time
-        end_time: Processing end time
+        elapsed_seconds: Processing duration in seconds
 
     Returns:
         Statistics dictionary
     """
     total = len(results)
-    consistent_count = sum(1 for r in results.values() if r['is_consistent'])
-
-    # Count flags
-    by_flag: Dict[str, int] = {}
-    by_severity: Dict[str, int] = {'error': 0, 'warning': 0, 'info': 0}
+    values = results.values()
+    consistent_count = sum(map(itemgetter('is_consistent'), values))
 
-    for result in results.values():
-        for flag in result['flags']:
-            by_flag[flag['code']] = by_flag.get(flag['code'], 0) + 1
-            by_severity[flag['severity']] += 1
+    # Count flags (Counter tallies in C and keeps first-seen order for ties)
+    all_flags = list(chain.from_iterable(map(itemgetter('flags'), values)))
+    by_flag = Counter(map(itemgetter('code'), all_flags))
+    by_severity = Counter({'error': 0, 'warning': 0, 'info': 0})
+    by_severity.update(map(itemgetter('severity'), all_flags))
 
     # Average consistency score
-    avg_score = sum(r['consistency_score'] for r in results.values()) / total if total > 0 else 0
+    avg_score = sum(map(itemgetter('consistency_score'), values)) / total if total > 0 else 0
 
     # Processing time
-    duration = end_time - start_time
-    processing_time = str(duration).split('.')[0]
+    processing_time = str(timedelta(seconds=int(elapsed_seconds)))
 
     return {
         'total_files': total,
         'consistent': consistent_count,
         'inconsistent': total - consistent_count,
         'consistency_rate': round(consistent_count / total, 4) if total > 0 else 0,
-        'by_flag': dict(sorted(by_flag.items(), key=lambda x: -x[1])),
-        'by_severity': by_severity,
+        'by_flag': dict(by_flag.most_common()),
+        'by_severity': dict(by_severity),
         'confusion_matrix': build_confusion_matrix(results),
         'average_consistency_score': round(avg_score, 4),
         'processing_time': processing_time
     }
 
 
-def process_analysis(input_path: Path, threshold: float) -> Dict[str, Any]:
+def process_analysis(input_path: Path, threshold: float, jobs: int = 1) -> Dict[str, Any]:
     """
     Main processing function - validate all files in analysis_complete.json.
 
     Args:
         input_path: Path to analysis_complete.json
         threshold: Minimum consistency score to consider valid
+        jobs: Number of worker processes used for validation
 
     Returns:
         Complete validation output dictionary
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
 
     print(f"Loading analysis from {input_path}...", file=sys.stderr)
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if HAS_ORJSON:
+        with open(input_path, 'rb') as f:
+            data = orjson.loads(f.read())
+    else:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     source_results = data.get('results', {})
     print(f"Found {len(source_results)} files to validate", file=sys.stderr)
 
     validation_results: Dict[str, Dict] = {}
 
+    # Entries are independent; map() keeps results in input order. Large
+    # chunks amortize pickling, since each entry is only a few dicts.
+    file_results = map_jobs(
+        validate_file, source_results.values(), repeat(threshold),
+        jobs=jobs, chunksize=512,
+    )
+
     # Progress iterator
     if HAS_TQDM:
-        iterator = tqdm(source_results.items(), desc="Validating", file=sys.stderr)
+        file_results = tqdm(file_results, total=len(source_results), desc="Validating", file=sys.stderr)
     else:
-        iterator = source_results.items()
         print("Processing...", file=sys.stderr)
 
-    for idx, (filename, entry) in enumerate(iterator):
-        validation_results[filename] = validate_file(entry, threshold)
+    for idx, (result, filename) in enumerate(zip(file_results, source_results)):
+        validation_results[filename] = result
 
         # Progress update without tqdm
         if not HAS_TQDM and (idx + 1) % 10000 == 0:
             print(f"Processed {idx + 1}/{len(source_results)} files...", file=sys.stderr)
 
-    end_time = datetime.now()
+    elapsed_seconds = time.perf_counter() - start_time
 
     return {
         'metadata': {
@@ -475,7 +565,7 @@ def process_analysis(input_path: Path, threshold: float) -> Dict[str, Any]:
             'total_validated': len(validation_results),
             'validation_threshold': threshold
         },
-        'statistics': generate_statistics(validation_results, threshold, start_time, end_time),
+        'statistics': generate_statistics(validation_results, threshold, elapsed_seconds),
         'validation_results': validation_results
     }
 
@@ -539,6 +629,13 @@ Output:
         help="Only output files flagged as inconsistent"
     )
 
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)"
+    )
+
     args = parser.parse_args()
 
     # Validate input file
@@ -555,28 +652,34 @@ Output:
     print(f"Threshold: {args.consistency_threshold}", file=sys.stderr)
     print("=" * 60, file=sys.stderr)
 
-    output = process_analysis(args.input, args.consistency_threshold)
+    output = process_analysis(args.input, args.consistency_threshold, args.jobs)
 
-    # Filter results if requested
-    if args.only_inconsistent:
+    # Filter results if requested (both filters in a single pass, so only one
+    # filtered copy of the results is built)
+    min_severity = SEVERITY_ORDER.get(args.severity_filter)
+    if args.only_inconsistent or min_severity is not None:
         output['validation_results'] = {
             k: v for k, v in output['validation_results'].items()
-            if not v['is_consistent']
+            if not (args.only_inconsistent and v['is_consistent'])
+            and (min_severity is None
+                 or any(SEVERITY_ORDER[f['severity']] >= min_severity for f in v['flags']))
         }
+
+    if args.only_inconsistent:
         output['metadata']['filtered'] = 'only_inconsistent'
 
-    if args.severity_filter != 'all':
-        min_severity = SEVERITY_ORDER[args.severity_filter]
-        output['validation_results'] = {
-            k: v for k, v in output['validation_results'].items()
-            if any(SEVERITY_ORDER[f['severity']] >= min_severity for f in v['flags'])
-        }
+    if min_severity is not None:
         output['metadata']['severity_filter'] = args.severity_filter
 
     # Write output
     print(f"\nWriting results to {args.output}...", file=sys.stderr)
-    with open(args.output, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if HAS_ORJSON:
+        # Same layout as json.dump(indent=2, ensure_ascii=False), serialized in C
+        with open(args.output, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
 
     # Print summary
     stats = output['statistics']